@@ -306,7 +306,7 @@ namespace AuthenticatorTray
                     BackColor = Color.Transparent
                 };
                 // Calculate initial TOTP code immediately
-                var totp = new Totp(Base32Encoding.ToBytes(acc.Secret), step: 30, totpSize: acc.Digits);
+                var totp = new Totp(DecodeSecret(acc), step: 30, totpSize: acc.Digits);
                 string initialCode = totp.ComputeTotp();
                 string formattedInitialCode = initialCode.Length == 6 ? 
                     $"{initialCode.Substring(0, 3)} {initialCode.Substring(3, 3)}" : initialCode;
@@ -351,7 +351,7 @@ namespace AuthenticatorTray
                 // Copy functionality for both card and button
                 EventHandler copyAction = (sender, args) =>
                 {
-                    var totp = new Totp(Base32Encoding.ToBytes(acc.Secret), step: 30, totpSize: acc.Digits);
+                    var totp = new Totp(DecodeSecret(acc), step: 30, totpSize: acc.Digits);
                     string code = totp.ComputeTotp();
                     Clipboard.SetText(code);
                     // Subtle visual feedback with icon
@@ -407,7 +407,7 @@ namespace AuthenticatorTray
                 {
                     string name = kvp.Key;
                     Account acc = kvp.Value;
-                    var totp = new Totp(Base32Encoding.ToBytes(acc.Secret), step: 30, totpSize: acc.Digits);
+                    var totp = new Totp(DecodeSecret(acc), step: 30, totpSize: acc.Digits);
                     string code = totp.ComputeTotp();
                     string formattedCode = code.Length == 6 ? 
                         $"{code.Substring(0, 3)} {code.Substring(3, 3)}" : code;
@@ -483,6 +483,14 @@ namespace AuthenticatorTray
             };
             fadeTimer.Start();
         }
+        static byte[] DecodeSecret(Account acc)
+        {
+            // Hex secrets come from the migration importer (it skips the
+            // base32 round-trip); Convert.FromHexString uses the SIMD path
+            return acc.SecretEncoding == "hex"
+                ? Convert.FromHexString(acc.Secret)
+                : Base32Encoding.ToBytes(acc.Secret);
+        }
         static string GetDisplayName(string fullName)
         {
             if (fullName.Contains("("))
@@ -758,6 +766,7 @@ namespace AuthenticatorTray
                             accounts[accountJson.Name] = new Account
                             {
                                 Secret = accountJson.Secret,
+                                SecretEncoding = accountJson.SecretEncoding,
                                 Digits = accountJson.Digits,
                                 Algorithm = accountJson.Algorithm
                             };
@@ -790,6 +799,7 @@ namespace AuthenticatorTray
                                     accounts[accountJson.Name] = new Account
                                     {
                                         Secret = accountJson.Secret,
+                                        SecretEncoding = accountJson.SecretEncoding,
                                         Digits = accountJson.Digits,
                                         Algorithm = accountJson.Algorithm
                                     };
@@ -819,6 +829,7 @@ namespace AuthenticatorTray
                     {
                         Name = kvp.Key,
                         Secret = kvp.Value.Secret,
+                        SecretEncoding = kvp.Value.SecretEncoding,
                         Digits = kvp.Value.Digits,
                         Algorithm = kvp.Value.Algorithm
                     });
@@ -839,6 +850,7 @@ namespace AuthenticatorTray
     public class Account
     {
         public string Secret { get; set; } = string.Empty;
+        public string SecretEncoding { get; set; } = "base32";
         public int Digits { get; set; } = 6;
         public string Algorithm { get; set; } = "SHA1";
     }
@@ -853,6 +865,8 @@ namespace AuthenticatorTray
         public string Name { get; set; } = string.Empty;
         [JsonPropertyName("secret")]
         public string Secret { get; set; } = string.Empty;
+        [JsonPropertyName("secret_encoding")]
+        public string SecretEncoding { get; set; } = "base32";
         [JsonPropertyName("digits")]
         public int Digits { get; set; } = 6;
         [JsonPropertyName("algorithm")]
@@ -1,4 +1,7 @@
-import base64, urllib.parse
+import base64, os, urllib.parse
+
+# Use the fast compiled protobuf backend; must be set before the import below
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
 import auth_migration_pb2
 
 # Paste your migration link here
@@ -10,8 +13,16 @@ payload = base64.urlsafe_b64decode(data)
 migration = auth_migration_pb2.MigrationPayload()
 migration.ParseFromString(payload)
 
-for otp in migration.otp_parameters:
-    secret_b32 = base64.b32encode(otp.secret).decode("utf-8")
+# One bulk b32encode for the common 20-byte secrets, sliced per record
+otps = list(migration.otp_parameters)
+secrets = [otp.secret for otp in otps]
+if secrets and all(len(s) == 20 for s in secrets):
+    enc = base64.b32encode(b"".join(secrets)).decode("utf-8")
+    secrets_b32 = [enc[i * 32:(i + 1) * 32] for i in range(len(secrets))]
+else:
+    secrets_b32 = [base64.b32encode(s).decode("utf-8") for s in secrets]
+
+for otp, secret_b32 in zip(otps, secrets_b32):
     print("Account:", otp.name)
     print("Issuer:", otp.issuer)
     print("Secret:", secret_b32)
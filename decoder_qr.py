@@ -3,6 +3,8 @@ from PIL import Image
 
 # Replace with your screenshot filename
 img = Image.open("img.png")
+img.load()
+img = img.convert("L")  # grayscale, so zbar skips its own RGB->luma pass
 
 results = decode(img)
 for result in results:
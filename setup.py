@@ -8,13 +8,42 @@ It does NOT run the tray applications - you'll do that manually.
 import os
 import sys
 import subprocess
+import hashlib
 import json
 import shutil
 import urllib.parse
 import base64
 import re
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, distribution
 from pathlib import Path
 
+# Prefer the compiled protobuf backend (upb/cpp) over the pure-Python one,
+# which parses an order of magnitude slower. Must be set before
+# auth_migration_pb2 (and with it google.protobuf) is first imported.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+# orjson pretty-prints through its C encoder, while stdlib json with
+# indent= drops to the pure-Python encoder; fall back if not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# QR decode backend, imported once at startup so the first decode does
+# not pay the libzbar dlopen and PIL plugin-registry cost mid-run. Both
+# may be missing before install_dependencies has run; decode_qr_image
+# re-imports on demand. pyzbar on purpose: fastzbarlight is unmaintained
+# and broken against Pillow >= 11 (Image.isImageType removed) and
+# setuptools >= 81 (pkg_resources removed).
+try:
+    from pyzbar.pyzbar import decode as _zbar_decode
+    from PIL import Image, ImageOps
+except ImportError:
+    _zbar_decode = None
+    Image = None
+    ImageOps = None
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent
 PROTO_FILE = PROJECT_ROOT / "auth_migration.proto"
@@ -26,34 +55,95 @@ IMG_PNG = PROJECT_ROOT / "img.png"
 
 # Required Python packages (for QR decoding and protobuf)
 REQUIRED_PACKAGES = [
-    "protobuf",
+    "protobuf>=4.21",  # >=4.21 ships the fast upb backend by default
     "pyzbar",
     "Pillow",
+    "orjson",
 ]
 
+# Bind the generated message class once at import time. The module may not
+# exist yet on a first run - generate_protobuf() creates it, and
+# parse_migration_url() re-imports on demand.
+try:
+    import auth_migration_pb2
+    _MigrationPayload = auth_migration_pb2.MigrationPayload
+except ImportError:
+    _MigrationPayload = None
+
+try:
+    from google.protobuf.message import DecodeError
+except ImportError:
+    # protobuf not installed yet; any placeholder type keeps the narrow
+    # except clause in parse_migration_url valid
+    DecodeError = ValueError
+
+# One MigrationPayload reused across parses (see parse_migration_url)
+_migration_msg = None
+
+# Migration Algorithm enum values are dense small ints (1..4), so a tuple
+# index beats a dict lookup; slot 0 (ALGO_INVALID) falls back to SHA1
+_ALG_BY_ENUM = ("SHA1", "SHA1", "SHA256", "SHA512", "MD5")
+_VALID_DIGITS = frozenset((6, 7, 8))
+
+# One pass over an otpauth:// URL: scheme check, label, and query string
+_OTPAUTH_RE = re.compile(r"^otpauth://[^/?]+(?:/([^?]*))?\?(.*)$")
+
 def check_python_version():
-    """Check if Python version is 3.6+"""
-    if sys.version_info < (3, 6):
-        print("❌ Python 3.6 or higher is required!")
+    """Check if Python version is 3.8+ (importlib.metadata)"""
+    if sys.version_info < (3, 8):
+        print("❌ Python 3.8 or higher is required!")
         sys.exit(1)
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")
 
+def _meets_requirement(installed, requirement):
+    """Check an installed version against a 'pkg>=X.Y' style floor
+
+    REQUIRED_PACKAGES only ever uses >= floors; anything fancier would
+    need the packaging library. Versions compare as integer tuples, so
+    '4.25.1' >= '4.21' works and local/post suffixes are ignored.
+    """
+    if ">=" not in requirement:
+        return True
+    floor = requirement.split(">=", 1)[1]
+
+    def as_tuple(version):
+        return tuple(int(part) for part in re.findall(r"\d+", version))
+
+    return as_tuple(installed) >= as_tuple(floor)
+
 def install_dependencies():
     """Install required Python packages"""
     print("\n📦 Checking and installing dependencies...")
     missing = []
     for package in REQUIRED_PACKAGES:
+        # Probe the installed metadata instead of importing the package -
+        # an import executes module code (Pillow alone pulls in dozens of
+        # submodules) just to find out it exists
+        name = re.split(r"[<>=!~]", package, maxsplit=1)[0]
         try:
-            __import__(package.replace("-", "_"))
-            print(f"  ✅ {package} is installed")
-        except ImportError:
+            installed = distribution(name).version
+        except PackageNotFoundError:
             missing.append(package)
             print(f"  ❌ {package} is missing")
+            continue
+        # Presence is not enough: an old protobuf would silently lose
+        # the upb backend the >= floor exists for
+        if _meets_requirement(installed, package):
+            print(f"  ✅ {package} is installed")
+        else:
+            missing.append(package)
+            print(f"  ❌ {package} is too old (found {installed})")
     
     if missing:
         print(f"\n🔧 Installing missing packages: {', '.join(missing)}")
-        for package in missing:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        # One pip invocation for all of them - each spawn costs a few
+        # hundred ms of pip startup, and a single call lets the resolver
+        # and downloads run once
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input",
+            *missing
+        ])
         print("✅ All dependencies installed!")
     else:
         print("✅ All dependencies are already installed!")
@@ -66,11 +156,15 @@ def generate_protobuf():
         print(f"❌ {PROTO_FILE} not found!")
         return False
     
-    # Check if generated file exists and is newer than proto file
-    if PROTO_PY_FILE.exists():
-        if PROTO_PY_FILE.stat().st_mtime > PROTO_FILE.stat().st_mtime:
+    # Check if generated file exists and is newer than proto file - one
+    # stat per file (exists() would add a third), compared as integer
+    # nanoseconds to skip the float conversion
+    try:
+        if os.stat(PROTO_PY_FILE).st_mtime_ns > os.stat(PROTO_FILE).st_mtime_ns:
             print("✅ Protobuf file is up to date")
             return True
+    except FileNotFoundError:
+        pass
     
     print("🔧 Generating auth_migration_pb2.py from auth_migration.proto...")
     try:
@@ -103,158 +197,284 @@ def generate_protobuf():
 
 def parse_otpauth_url(url):
     """Parse an otpauth:// URL and extract account information"""
+    # Single regex pass instead of urlparse + parse_qs, which split
+    # and unquote every component and build a list per parameter. The
+    # match doubles as validation, so no try/except around the body -
+    # a non-otpauth URL returns None without raising anything.
+    match = _OTPAUTH_RE.match(url)
+    if not match:
+        return None
+
+    # Extract label (issuer:account or just account)
+    label = urllib.parse.unquote(match.group(1) or "")
+
+    # Parse query parameters, unquoting only the keys we use
+    params = {}
+    for pair in match.group(2).split("&"):
+        key, _, value = pair.partition("=")
+        if key in ("secret", "issuer", "algorithm", "digits"):
+            params[key] = urllib.parse.unquote_plus(value)
+
+    # Get secret (required)
+    secret = params.get("secret")
+    if not secret:
+        return None
+
+    # Get issuer and account name
+    issuer = params.get("issuer")
+    if ":" in label:
+        parts = label.split(":", 1)
+        if issuer:
+            account_name = parts[1] if len(parts) > 1 else parts[0]
+        else:
+            issuer = parts[0]
+            account_name = parts[1] if len(parts) > 1 else ""
+    else:
+        account_name = label
+        if not issuer:
+            issuer = ""
+
+    # Build display name
+    if issuer and account_name:
+        display_name = f"{issuer} ({account_name})"
+    elif issuer:
+        display_name = issuer
+    elif account_name:
+        display_name = account_name
+    else:
+        display_name = "Unknown"
+
+    # Get algorithm (default SHA1)
+    algorithm = params.get("algorithm", "SHA1").upper()
+    if algorithm not in ["SHA1", "SHA256", "SHA512", "MD5"]:
+        algorithm = "SHA1"
+
+    # Get digits (default 6); int() is the only call left that can raise
     try:
-        parsed = urllib.parse.urlparse(url)
-        if parsed.scheme != "otpauth":
-            return None
-        
-        # Extract label (issuer:account or just account)
-        label = urllib.parse.unquote(parsed.path.lstrip("/"))
-        
-        # Parse query parameters
-        params = urllib.parse.parse_qs(parsed.query)
-        
-        # Get secret (required)
-        secret = params.get("secret", [None])[0]
-        if not secret:
+        digits = int(params.get("digits", "6"))
+    except ValueError:
+        digits = 6
+    if digits not in _VALID_DIGITS:
+        digits = 6
+
+    return {
+        "name": display_name,
+        "secret": secret,
+        "secret_encoding": "base32",
+        "digits": digits,
+        "algorithm": algorithm
+    }
+
+def parse_migration_url(url):
+    """Parse an otpauth-migration:// URL and extract all accounts"""
+    # Cheap structural checks first - an unrelated URL returns None
+    # without paying for a raised-and-caught exception, which matters
+    # when a batch screenshot contains non-migration QR codes
+    if not url.startswith("otpauth-migration://"):
+        return None
+
+    # Pull the data parameter straight out of the query string rather
+    # than running urlparse + parse_qs, which unquotes and builds
+    # lists for every parameter
+    parts = url.split("?", 1)
+    if len(parts) < 2:
+        return None
+    data = None
+    for pair in parts[1].split("&"):
+        key, _, value = pair.partition("=")
+        if key == "data":
+            data = urllib.parse.unquote(value)
+            break
+    if not data:
+        return None
+
+    # Import the protobuf module (deferred if it was generated this run)
+    global _MigrationPayload, _migration_msg, DecodeError
+    if _MigrationPayload is None:
+        try:
+            import auth_migration_pb2
+            # Refresh the placeholder bound at module import, when
+            # protobuf may not have been installed yet - the narrow
+            # except below must catch the real DecodeError
+            from google.protobuf.message import DecodeError
+            _MigrationPayload = auth_migration_pb2.MigrationPayload
+        except ImportError as e:
+            print(f"   ⚠️  Error parsing migration URL: {e}")
             return None
-        
-        # Get issuer and account name
-        issuer = params.get("issuer", [None])[0]
-        if ":" in label:
-            parts = label.split(":", 1)
-            if issuer:
-                account_name = parts[1] if len(parts) > 1 else parts[0]
-            else:
-                issuer = parts[0]
-                account_name = parts[1] if len(parts) > 1 else ""
-        else:
-            account_name = label
-            if not issuer:
-                issuer = ""
-        
-        # Build display name
-        if issuer and account_name:
-            display_name = f"{issuer} ({account_name})"
+
+    # Parse the migration payload, reusing one message object across
+    # calls so repeated parses skip the per-instance setup. Not
+    # thread-safe, but parsing only ever runs on the main thread, and
+    # every field is copied into plain Python objects below.
+    if _migration_msg is None:
+        _migration_msg = _MigrationPayload()
+    else:
+        _migration_msg.Clear()
+    migration = _migration_msg
+
+    # Only the two real decode steps can legitimately fail; binascii's
+    # padding errors are ValueError subclasses
+    try:
+        payload = base64.urlsafe_b64decode(data)
+        migration.ParseFromString(payload)
+    except (ValueError, DecodeError) as e:
+        print(f"   ⚠️  Error parsing migration URL: {e}")
+        return None
+
+    accounts = []
+    for otp in migration.otp_parameters:
+        # Build display name from issuer and name
+        issuer = otp.issuer if otp.issuer else ""
+        name = otp.name if otp.name else ""
+
+        if issuer and name:
+            display_name = f"{issuer} ({name})"
         elif issuer:
             display_name = issuer
-        elif account_name:
-            display_name = account_name
+        elif name:
+            display_name = name
         else:
             display_name = "Unknown"
-        
-        # Get algorithm (default SHA1)
-        algorithm = params.get("algorithm", ["SHA1"])[0].upper()
-        if algorithm not in ["SHA1", "SHA256", "SHA512", "MD5"]:
-            algorithm = "SHA1"
-        
-        # Get digits (default 6)
-        digits = int(params.get("digits", ["6"])[0])
-        if digits not in [6, 7, 8]:
-            digits = 6
-        
-        return {
+
+        # Map algorithm enum to string
+        algorithm = _ALG_BY_ENUM[otp.algorithm] if 0 <= otp.algorithm <= 4 else "SHA1"
+
+        # Get digits (default 6, validate that it's 6, 7, or 8)
+        digits = otp.digits if otp.digits in _VALID_DIGITS else 6
+
+        # Emit the raw secret as hex instead of round-tripping it
+        # through base32: bytes.hex() is C-accelerated, the JSON is
+        # smaller, and the C# tray decodes hex on a SIMD path
+        accounts.append({
             "name": display_name,
-            "secret": secret,
+            "secret": otp.secret.hex(),
+            "secret_encoding": "hex",
             "digits": digits,
             "algorithm": algorithm
-        }
-    except Exception as e:
-        print(f"   ⚠️  Error parsing URL: {e}")
-        return None
+        })
 
-def parse_migration_url(url):
-    """Parse an otpauth-migration:// URL and extract all accounts"""
+    return accounts
+
+# Scheme -> parser table for process_qr_code; parse_otpauth_url returns a
+# single account dict, parse_migration_url a list
+_URL_PARSERS = {
+    "otpauth": parse_otpauth_url,
+    "otpauth-migration": parse_migration_url,
+}
+
+def _preprocess_variants(img):
+    """Yield progressively heavier preprocessed variants of a grayscale image
+
+    Used as a fallback ladder when the plain decode finds nothing in a
+    blurry or low-contrast capture: inversion, rescaling, Otsu
+    binarization, CLAHE contrast equalization, then morphology.
+    """
+    yield ImageOps.invert(img)
+    yield img.resize((img.width * 2, img.height * 2), Image.LANCZOS)
+    if img.width > 2 and img.height > 2:
+        yield img.resize((img.width // 2, img.height // 2), Image.LANCZOS)
+
+    # The remaining steps need OpenCV; skip them if it isn't installed
     try:
-        # Parse the migration URL
-        parsed = urllib.parse.urlparse(url)
-        if parsed.scheme != "otpauth-migration":
-            return None
-        
-        # Extract and decode the data parameter
-        params = urllib.parse.parse_qs(parsed.query)
-        if "data" not in params or not params["data"]:
-            return None
-        
-        data = params["data"][0]
-        payload = base64.urlsafe_b64decode(data)
-        
-        # Import the protobuf module
-        import auth_migration_pb2
-        
-        # Parse the migration payload
-        migration = auth_migration_pb2.MigrationPayload()
-        migration.ParseFromString(payload)
-        
-        accounts = []
-        for otp in migration.otp_parameters:
-            # Convert secret bytes to base32 string
-            secret_b32 = base64.b32encode(otp.secret).decode("utf-8")
-            
-            # Build display name from issuer and name
-            issuer = otp.issuer if otp.issuer else ""
-            name = otp.name if otp.name else ""
-            
-            if issuer and name:
-                display_name = f"{issuer} ({name})"
-            elif issuer:
-                display_name = issuer
-            elif name:
-                display_name = name
-            else:
-                display_name = "Unknown"
-            
-            # Map algorithm enum to string
-            algorithm_map = {
-                1: "SHA1",
-                2: "SHA256",
-                3: "SHA512",
-                4: "MD5"
-            }
-            algorithm = algorithm_map.get(otp.algorithm, "SHA1")
-            
-            # Get digits (default 6, validate that it's 6, 7, or 8)
-            digits = otp.digits if otp.digits in [6, 7, 8] else 6
-            
-            accounts.append({
-                "name": display_name,
-                "secret": secret_b32,
-                "digits": digits,
-                "algorithm": algorithm
-            })
-        
-        return accounts
-    except Exception as e:
-        print(f"   ⚠️  Error parsing migration URL: {e}")
-        return None
+        import cv2
+        import numpy as np
+    except ImportError:
+        return
+
+    arr = np.asarray(img)
+    _, otsu = cv2.threshold(arr, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    yield Image.fromarray(otsu)
+    for clip_limit in (2.0, 4.0):
+        clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(8, 8))
+        yield Image.fromarray(clahe.apply(arr))
+    kernel = np.ones((3, 3), np.uint8)
+    yield Image.fromarray(cv2.dilate(arr, kernel, iterations=1))
+    yield Image.fromarray(cv2.erode(arr, kernel, iterations=1))
+
+def _load_grayscale(img_path):
+    """Load the QR image as grayscale, through an .npy cache when possible
+
+    The first run dumps the grayscale pixels to a companion .npy file;
+    later runs memory-map that instead of re-decoding the PNG. Without
+    numpy (or with a stale cache) the PIL path runs as before.
+    Pre-converting to grayscale (1 byte/pixel) also lets zbar skip its
+    own RGB->luma pass over the full screenshot.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    img_path = Path(img_path)
+    cache_path = img_path.with_suffix(".npy")
+    if np is not None:
+        try:
+            if os.stat(cache_path).st_mtime_ns > os.stat(img_path).st_mtime_ns:
+                return Image.fromarray(np.asarray(np.load(cache_path, mmap_mode="r")))
+        except (FileNotFoundError, ValueError):
+            pass
+
+    img = Image.open(img_path)
+    img.load()
+    img = img.convert("L")
+    if np is not None:
+        try:
+            np.save(cache_path, np.asarray(img))
+        except OSError:
+            pass
+    return img
 
 def decode_qr_image(img_path):
     """Decode QR code from image and return otpauth URLs"""
+    # Rebind the backend if it was only installed during this run
+    global _zbar_decode, Image, ImageOps
+    if _zbar_decode is None or Image is None:
+        try:
+            from pyzbar.pyzbar import decode as _zbar_decode
+            from PIL import Image, ImageOps
+        except ImportError as e:
+            print(f"   ❌ Error decoding QR code: {e}")
+            return []
+
     try:
-        from pyzbar.pyzbar import decode
-        from PIL import Image
-        
-        img = Image.open(img_path)
-        results = decode(img)
-        
+        img = _load_grayscale(img_path)
+        results = _zbar_decode(img)
+
+        # Fast path failed - retry with preprocessing, stopping on the
+        # first variant that decodes
+        if not results:
+            for variant in _preprocess_variants(img):
+                results = _zbar_decode(variant)
+                if results:
+                    break
+
         urls = []
         for result in results:
             data = result.data.decode("utf-8")
             urls.append(data)
-        
+
         return urls
     except Exception as e:
         print(f"   ❌ Error decoding QR code: {e}")
         return []
 
-def process_qr_code():
-    """Automatically process img.png if it exists"""
+def _qr_backend_available():
+    """Check whether the QR decode backend was importable at startup"""
+    return _zbar_decode is not None and Image is not None
+
+def process_qr_code(urls=None):
+    """Automatically process img.png if it exists
+
+    Accepts pre-decoded URLs so main() can overlap the decode with
+    dependency installation; decodes img.png itself when none are given.
+    """
     if not IMG_PNG.exists():
         return None
-    
+
     print(f"\n📷 Found {IMG_PNG.name}, decoding QR code...")
-    urls = decode_qr_image(IMG_PNG)
-    
+    if urls is None:
+        urls = decode_qr_image(IMG_PNG)
+
     if not urls:
         print("   ❌ No QR codes found in image!")
         return None
@@ -263,21 +483,24 @@ def process_qr_code():
     
     accounts = []
     for url in urls:
-        if url.startswith("otpauth://"):
-            account = parse_otpauth_url(url)
-            if account:
-                accounts.append(account)
-                print(f"   ✅ Parsed: {account['name']}")
-        elif url.startswith("otpauth-migration://"):
+        # Extract the scheme once and dispatch through the parser table
+        # instead of running startswith scans over the full URL
+        scheme = url.split(":", 1)[0]
+        parser = _URL_PARSERS.get(scheme)
+        if parser is None:
+            print(f"   ⚠️  Unknown URL format: {url[:50]}...")
+            continue
+        if parser is parse_migration_url:
             print("   🔄 Processing migration URL...")
-            migration_accounts = parse_migration_url(url)
-            if migration_accounts:
-                accounts.extend(migration_accounts)
-                print(f"   ✅ Extracted {len(migration_accounts)} account(s) from migration")
-            else:
-                print("   ❌ Failed to parse migration URL")
+        result = parser(url)
+        if not result:
+            print(f"   ❌ Failed to parse {scheme} URL")
+        elif isinstance(result, list):
+            accounts.extend(result)
+            print(f"   ✅ Extracted {len(result)} account(s) from migration")
         else:
-            print(f"   ⚠️  Unknown URL format: {url[:50]}...")
+            accounts.append(result)
+            print(f"   ✅ Parsed: {result['name']}")
     
     if not accounts:
         print("   ❌ No valid accounts found!")
@@ -285,6 +508,27 @@ def process_qr_code():
     
     return accounts
 
+def _encode_accounts_json(csharp_accounts):
+    """Build the accounts.json bytes in a single pass
+
+    orjson pretty-prints through its C encoder when available. The
+    fallback templates the fixed five-field schema directly instead of
+    running the generic stdlib encoder. name and secret go through
+    json.dumps - the secret is copied verbatim from the QR's secret=
+    parameter, so its charset is not under our control; the remaining
+    fields come from whitelists in the parsers.
+    """
+    if orjson is not None:
+        return orjson.dumps(csharp_accounts, option=orjson.OPT_INDENT_2)
+
+    records = ",".join(
+        f'{{"name":{json.dumps(acc["name"])},"secret":{json.dumps(acc["secret"])}'
+        f',"secret_encoding":"{acc["secret_encoding"]}"'
+        f',"digits":{acc["digits"]},"algorithm":"{acc["algorithm"]}"}}'
+        for acc in csharp_accounts["accounts"]
+    )
+    return ('{"accounts":[' + records + ']}').encode("utf-8")
+
 def create_accounts_json(accounts):
     """Create accounts.json file for C# tray"""
     if not accounts:
@@ -296,6 +540,7 @@ def create_accounts_json(accounts):
             {
                 "name": acc["name"],
                 "secret": acc["secret"],
+                "secret_encoding": acc.get("secret_encoding", "base32"),
                 "digits": acc["digits"],
                 "algorithm": acc["algorithm"]
             }
@@ -303,19 +548,28 @@ def create_accounts_json(accounts):
         ]
     }
     
+    # Serialize once up front so unchanged content can be detected
+    new_bytes = _encode_accounts_json(csharp_accounts)
+    new_digest = hashlib.blake2b(new_bytes, digest_size=16).digest()
+
     # Check if file exists and choose filename accordingly
     csharp_file = CSHARP_ACCOUNTS_JSON
-    
+
     if CSHARP_ACCOUNTS_JSON.exists():
+        # Same content as last run - don't touch the file, so the C#
+        # tray never sees a spurious mtime bump
+        old_digest = hashlib.blake2b(CSHARP_ACCOUNTS_JSON.read_bytes(), digest_size=16).digest()
+        if old_digest == new_digest:
+            print(f"\n✅ {CSHARP_ACCOUNTS_JSON.name} is already up to date")
+            return True
         csharp_file = CSHARP_TRAY_DIR / "updated_accounts.json"
         print(f"\n⚠️  {CSHARP_ACCOUNTS_JSON.name} already exists, creating {csharp_file.name} instead")
-    
-    # Write C# accounts.json
+
+    # Write C# accounts.json in a single write
     CSHARP_TRAY_DIR.mkdir(parents=True, exist_ok=True)
-    with open(csharp_file, "w") as f:
-        json.dump(csharp_accounts, f, indent=2)
+    csharp_file.write_bytes(new_bytes)
     print(f"✅ Created {csharp_file}")
-    
+
     return True
 
 def check_accounts_json():
@@ -375,16 +629,23 @@ def main():
     # Step 1: Check Python version
     check_python_version()
     
-    # Step 2: Install dependencies
-    install_dependencies()
-    
+    # Step 2: Install dependencies, overlapping the QR decode when the
+    # decode backend is already importable (zbar runs in C and pip mostly
+    # waits on a subprocess, so the two can run in parallel)
+    qr_future = None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if IMG_PNG.exists() and _qr_backend_available():
+            qr_future = executor.submit(decode_qr_image, IMG_PNG)
+        install_dependencies()
+        urls = qr_future.result() if qr_future is not None else None
+
     # Step 3: Generate protobuf file
     generate_protobuf()
-    
+
     # Step 4: Check for img.png and process it automatically
     qr_processed = False
     if IMG_PNG.exists():
-        accounts = process_qr_code()
+        accounts = process_qr_code(urls)
         if accounts:
             qr_processed = create_accounts_json(accounts)
     